@@ -86,6 +86,31 @@ THIS_YEAR = rf"this{SEP_CHARS_REGEX}year'?s?"
 WEEKDAYS = (
     r"monday|tuesday|wednesday|thursday|friday|saturday|sunday|mon|tues?|wed|thu|thurs?|fri|sat|sun"
 )
+WEEKDAY_MODIFIERS = r"last|next|this"
+RELATIVE_IN = r"in"
 TIME_PERIOD = r"am|pm"
 QUARTER = r"[Qq][1-4]"
 RELATIVE_UNIT = r"days?|weeks?|months?|years?"
+# Tokens that can begin a date match. pattern_factory builds its anchor pre-scan from these, so a
+# new pattern starting with a token not covered here must add that token.
+LEADING_TOKENS = (
+    r"\d",
+    QUARTER,
+    MONTH,
+    DAY_NUMBERS,
+    WEEKDAYS,
+    WEEKDAY_MODIFIERS,
+    RELATIVE_IN,
+    TODAY,
+    YESTERDAY,
+    TOMORROW,
+    LAST_WEEK,
+    NEXT_WEEK,
+    THIS_WEEK,
+    LAST_MONTH,
+    NEXT_MONTH,
+    THIS_MONTH,
+    LAST_YEAR,
+    NEXT_YEAR,
+    THIS_YEAR,
+)
@@ -1,6 +1,6 @@
 """Datefind is a Python library for finding dates in text."""
 
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
@@ -49,11 +49,9 @@ _SIMPLE_OFFSET_DAYS = {
     "this_month": 0,
     "this_year": 0,
 }
-_MONTH_ADJUSTMENTS = {"last_month": -1, "next_month": 1}
-_YEAR_ADJUSTMENTS = {"last_year": -1, "next_year": 1}
-_RELATIVE_DATE_KEYS = (
-    frozenset(_SIMPLE_OFFSET_DAYS) | frozenset(_MONTH_ADJUSTMENTS) | frozenset(_YEAR_ADJUSTMENTS)
-)
+# Tuples so they can be passed to `match.group(*keys)`, fetching several groups in one call
+_RELATIVE_DATE_KEYS = (*_SIMPLE_OFFSET_DAYS, "last_month", "next_month", "last_year", "next_year")
+_DATE_COMPONENT_KEYS = ("year", "month", "day", "month_as_text", "day_as_text", "quarter")
 
 # Two-letter keys cover the `xx?` optional-final-char alternation branches in
 # constants.MONTH (e.g., `jan?` can capture "ja"); three-letter keys cover standard
@@ -81,6 +79,14 @@ _MONTH_TEXT_MAP = {
     "dec": 12,
 }
 
+# Plain dict view of DayToNumber, avoiding Enum __getitem__ and .value on every match
+_DAY_TEXT_MAP = {member.name: member.value for member in DayToNumber}
+
+# Deletion table for stripping separators from spelled-out days (e.g. "twenty-first"). SEP_CHARS
+# is written as a regex character class, so its escaping backslash is deleted too; backslashes
+# never appear in a day_as_text match.
+_SEP_TABLE = str.maketrans("", "", SEP_CHARS)
+
 
 def _offset_months(now: datetime, n: int) -> datetime:
     """Offset a datetime by n months, carrying across year boundaries.
@@ -99,7 +105,7 @@ def _offset_months(now: datetime, n: int) -> datetime:
     return now.replace(year=now.year + year_offset, month=month_zero + 1)
 
 
-@dataclass
+@dataclass(slots=True)
 class FoundDate:
     """Store information about a date found in text.
 
@@ -134,8 +140,9 @@ class DateFind:
         self.text = text
         self.tz = tz
         self.first_number = first_number
-        self.base_date = datetime(datetime.now(self.tz).year, 1, 1, tzinfo=self.tz)
         self.factory = PatternFactory(first_number=self.first_number)
+        self._regex = self.factory.make_regex()
+        self._anchors = self.factory.make_anchor_regex()
 
     def find_dates(self) -> Generator[FoundDate, None, None]:
         """Search the text for date patterns and parse them into FoundDate objects.
@@ -145,28 +152,30 @@ class DateFind:
         Yields:
             Generator[FoundDate, None, None]: A sequence of FoundDate objects containing the parsed datetime, original text, matched pattern, and location of the match.
         """
-        regex = self.factory.make_regex()
-        now = datetime.now(self.tz)
+        tz = self.tz
+        now = datetime.now(tz)
 
-        for match in regex.finditer(self.text):
-            groups = match.groupdict()
+        for match in self._scan(0, len(self.text)):
             as_dt: datetime | None = None
 
-            if any(groups.get(k) for k in _RELATIVE_DATE_KEYS):
-                as_dt = self._handle_relative_dates(groups, now)
-            elif groups.get("rel_count"):
-                as_dt = self._handle_relative_count(groups, now)
-            elif groups.get("weekday") or groups.get("bare_weekday"):
-                as_dt = self._handle_weekday(groups, now)
-
-            has_date_component = any(
-                groups.get(key) for key in ("year", "month", "day", "month_as_text", "day_as_text")
-            )
-            if not as_dt and has_date_component:
-                day = self._day_to_number(groups) or 1
-                month = self._month_to_number(groups) or now.month
-                year = self._year_to_number(groups) or now.year
-                as_dt = datetime(year=int(year), month=month, day=day, tzinfo=self.tz)
+            if any(match.group(*_RELATIVE_DATE_KEYS)):
+                as_dt = self._handle_relative_dates(match, now)
+            elif match.group("rel_count"):
+                as_dt = self._handle_relative_count(match, now)
+            elif match.group("weekday") or match.group("bare_weekday"):
+                as_dt = self._handle_weekday(match, now)
+
+            if not as_dt:
+                # Fetch every date component in one call and hand the strings to the parsers
+                year, month, day, month_as_text, day_as_text, quarter = match.group(
+                    *_DATE_COMPONENT_KEYS
+                )
+                if year or month or day or month_as_text or day_as_text:
+                    year_num = self._year_to_number(year) or now.year
+                    month_num = self._month_to_number(month, month_as_text, quarter) or now.month
+                    day_num = self._day_to_number(day, day_as_text) or 1
+                    # Positional arguments skip keyword parsing in the datetime constructor
+                    as_dt = datetime(year_num, month_num, day_num, 0, 0, 0, 0, tz)
 
             if as_dt:
                 yield FoundDate(
@@ -175,59 +184,80 @@ class DateFind:
                     span=match.span(),
                 )
 
+    def _scan(self, pos: int, endpos: int) -> Iterator[re.Match]:
+        """Find master-regex matches between two positions, trying only anchored start positions.
+
+        Produce the same matches as `finditer` over the range, but attempt the full regex only where the anchor pattern reports a token that can begin a date. Positions inside a previous match are skipped, preserving finditer's non-overlapping semantics.
+
+        Args:
+            pos (int): The position in the text to start searching from
+            endpos (int): The position in the text to stop searching at
+
+        Yields:
+            re.Match: Non-overlapping regex matches ordered by start position
+        """
+        last_end = pos
+        for anchor in self._anchors.finditer(self.text, pos, endpos):
+            start = anchor.start()
+            if start < last_end:
+                continue
+            if match := self._regex.match(self.text, start, endpos):
+                last_end = match.end()
+                yield match
+
     @staticmethod
-    def _handle_relative_dates(groups: dict[str, str | None], now: datetime) -> datetime | None:
+    def _handle_relative_dates(  # noqa: PLR0911
+        match: re.Match, now: datetime
+    ) -> datetime | None:
         """Parse relative date patterns like 'today', 'yesterday', 'next week' into datetime objects.
 
         Convert relative date references in the matched text into concrete datetime objects using the configured timezone. Handles basic time periods (today/tomorrow/yesterday), same-period "this" references (this week/month/year), and relative time spans (last/next week/month/year).
 
         Args:
-            groups (dict[str, str | None]): The regex match groupdict containing relative date pattern groups
+            match (re.Match): The regex match containing relative date pattern groups
             now (datetime): The current time in the target timezone
 
         Returns:
             datetime | None: The parsed datetime object if a relative pattern was matched, None otherwise
         """
         for key, days in _SIMPLE_OFFSET_DAYS.items():
-            if groups.get(key):
+            if match.group(key):
                 return now + timedelta(days=days)
 
-        for key, delta in _MONTH_ADJUSTMENTS.items():
-            if groups.get(key):
-                try:
-                    return _offset_months(now, delta)
-                except ValueError:
-                    return None
-
-        for key, delta in _YEAR_ADJUSTMENTS.items():
-            if groups.get(key):
-                try:
-                    return now.replace(year=now.year + delta)
-                except ValueError:
-                    return None
+        try:
+            if match.group("last_month"):
+                return _offset_months(now, -1)
+            if match.group("next_month"):
+                return _offset_months(now, 1)
+            if match.group("last_year"):
+                return now.replace(year=now.year - 1)
+            if match.group("next_year"):
+                return now.replace(year=now.year + 1)
+        except ValueError:
+            return None
 
         return None
 
     @staticmethod
-    def _handle_weekday(groups: dict[str, str | None], now: datetime) -> datetime | None:
+    def _handle_weekday(match: re.Match, now: datetime) -> datetime | None:
         """Resolve weekday references to a concrete datetime.
 
         Convert bare weekday names (`Monday`) and modifier-prefixed weekdays (`next Monday`, `last Friday`, `this Tuesday`) into concrete datetime objects relative to the current date. Bare weekdays and `next`-prefixed resolve to the next occurrence (always future). `last`-prefixed resolves to the prior occurrence (always past). `this`-prefixed resolves to the next occurrence within 0-6 days (today if target is today).
 
         Args:
-            groups (dict[str, str | None]): The regex match groupdict containing weekday information in named groups
+            match (re.Match): The regex match containing weekday information in named groups
             now (datetime): The current time in the target timezone
 
         Returns:
             datetime | None: The resolved datetime, or None if no weekday group matched
         """
-        weekday_str = groups.get("weekday") or groups.get("bare_weekday")
+        weekday_str = match.group("weekday") or match.group("bare_weekday")
         if not weekday_str:
             return None
 
         target = _WEEKDAY_TO_NUM[weekday_str.lower()]
         current = now.weekday()
-        modifier = (groups.get("weekday_modifier") or "").lower()
+        modifier = (match.group("weekday_modifier") or "").lower()
 
         if modifier == "last":
             # `or 7` forces a full-week jump when target == current
@@ -240,23 +270,23 @@ class DateFind:
 
     @staticmethod
     def _handle_relative_count(  # noqa: PLR0911
-        groups: dict[str, str | None], now: datetime
+        match: re.Match, now: datetime
     ) -> datetime | None:
         """Resolve N-unit-ago / in-N-unit / N-unit-from-now expressions to a datetime.
 
         Compute a concrete datetime by offsetting the current time by N of the matched unit (days, weeks, months, years). Direction is determined by presence of the `rel_ago` named group: if set, subtracts; otherwise (for "in" and "from now") adds. Invalid target dates (e.g., Feb 29 + 1 year in a non-leap year) resolve to None.
 
         Args:
-            groups (dict[str, str | None]): The regex match groupdict containing rel_count, rel_unit, and optionally rel_ago
+            match (re.Match): The regex match containing rel_count, rel_unit, and optionally rel_ago
             now (datetime): The current time in the target timezone
 
         Returns:
             datetime | None: The resolved datetime, or None if no relative-count groups matched or the target date is invalid
         """
-        if not (count := groups.get("rel_count")) or not (unit := groups.get("rel_unit")):
+        if not (count := match.group("rel_count")) or not (unit := match.group("rel_unit")):
             return None
 
-        offset = int(count) * (-1 if groups.get("rel_ago") else 1)
+        offset = int(count) * (-1 if match.group("rel_ago") else 1)
         unit_lower = unit.lower().rstrip("s")
 
         try:
@@ -273,64 +303,69 @@ class DateFind:
         return None
 
     @staticmethod
-    def _year_to_number(groups: dict[str, str | None]) -> int | None:
-        """Parse a year string from a regex match into a numeric year.
+    def _year_to_number(year: str | None) -> int | None:
+        """Parse a matched year string into a numeric year.
 
         Convert 2-digit years to 4-digit years by prepending the current century. For example, '23' becomes '2023'.
 
         Args:
-            groups (dict[str, str | None]): The regex match groupdict containing year information in named groups
+            year (str | None): The text captured by the `year` group, if any
 
         Returns:
-            int: The numeric year value
+            int | None: The numeric year value, or None if no year found
         """
-        if year := groups.get("year"):
-            if len(year) == 2:  # noqa: PLR2004
-                return int(f"{CENTURY}{year}")
-            return int(year)
+        if year:
+            # Only 2-digit years can be below 100; 4-digit years are constrained to 19xx/20xx
+            number = int(year)
+            return number + CENTURY * 100 if number < 100 else number  # noqa: PLR2004
 
         return None
 
     @staticmethod
-    def _month_to_number(groups: dict[str, str | None]) -> int | None:
-        """Parse a month string or quarter designator from a regex match into a numeric month (1-12).
+    def _month_to_number(
+        month: str | None, month_as_text: str | None, quarter: str | None
+    ) -> int | None:
+        """Parse a matched month string or quarter designator into a numeric month (1-12).
 
-        Convert quarter designators (e.g. "Q2" → 4), text month names (e.g. "January", "Feb"), and numeric months from the regex match. Text matching is case-insensitive.
+        Convert quarter designators (e.g. "Q2" → 4), text month names (e.g. "January", "Feb"), and numeric months. Text matching is case-insensitive.
 
         Args:
-            groups (dict[str, str | None]): The regex match groupdict containing month or quarter information in named groups
+            month (str | None): The text captured by the `month` group, if any
+            month_as_text (str | None): The text captured by the `month_as_text` group, if any
+            quarter (str | None): The text captured by the `quarter` group, if any
 
         Returns:
-            int: The numeric month value (1-12)
+            int | None: The numeric month value (1-12), or None if no month found
         """
-        if quarter := groups.get("quarter"):
+        if quarter:
             return (int(quarter[-1]) - 1) * 3 + 1
 
-        if month_as_text := groups.get("month_as_text"):
-            return _MONTH_TEXT_MAP.get(month_as_text.lower()[:3])
+        if month_as_text:
+            # casefold() matches the regex's Unicode case folding (e.g. a long s folds to "s")
+            return _MONTH_TEXT_MAP.get(month_as_text[:3].casefold())
 
-        if month := groups.get("month"):
+        if month:
             return int(month)
 
         return None
 
     @staticmethod
-    def _day_to_number(groups: dict[str, str | None]) -> int | None:
-        """Parse a day string from a regex match into a numeric day of month.
+    def _day_to_number(day: str | None, day_as_text: str | None) -> int | None:
+        """Parse a matched day string into a numeric day of month.
 
-        Convert both text day representations (e.g. "1st", "2nd") and numeric days from the regex match.
+        Convert both text day representations (e.g. "first", "twenty-second") and numeric days.
 
         Args:
-            groups (dict[str, str | None]): The regex match groupdict containing day information in named groups
+            day (str | None): The text captured by the `day` group, if any
+            day_as_text (str | None): The text captured by the `day_as_text` group, if any
 
         Returns:
             int | None: The numeric day value, or None if no day found
         """
-        if day_as_text := groups.get("day_as_text"):
-            day_as_text = re.sub(rf"[{SEP_CHARS}]", "", day_as_text)
-            return DayToNumber[day_as_text.upper()].value
+        if day_as_text:
+            return _DAY_TEXT_MAP[day_as_text.translate(_SEP_TABLE).upper()]
 
-        if day := groups.get("day"):
+        if day:
             return int(day)
 
         return None
@@ -3,8 +3,12 @@
 Contains pattern definitions and factory classes for building flexible date-matching regular expressions that handle various date formats and styles.
 """
 
+from functools import cache
 from typing import assert_never
 
+# The master pattern reuses group names across alternatives (e.g. `year`, `month_as_text`) and
+# relies on variable-width lookbehind in START. Neither stdlib `re` nor RE2 support these, so the
+# third-party `regex` module is required.
 import regex as re
 
 from datefind.constants import (
@@ -15,6 +19,7 @@ from datefind.constants import (
     LAST_MONTH,
     LAST_WEEK,
     LAST_YEAR,
+    LEADING_TOKENS,
     MM,
     MM_FLEXIBLE,
     MONTH,
@@ -22,6 +27,7 @@ from datefind.constants import (
     NEXT_WEEK,
     NEXT_YEAR,
     QUARTER,
+    RELATIVE_IN,
     RELATIVE_UNIT,
     SEP_CHARS,
     THIS_MONTH,
@@ -29,6 +35,7 @@ from datefind.constants import (
     THIS_YEAR,
     TODAY,
     TOMORROW,
+    WEEKDAY_MODIFIERS,
     WEEKDAYS,
     YESTERDAY,
     YYYY,
@@ -152,7 +159,7 @@ YYYY_QUARTER = rf"""
 """
 RELATIVE_WEEKDAY = rf"""
     {START}
-    (?<!\w)(?P<weekday_modifier>last|next|this)
+    (?<!\w)(?P<weekday_modifier>{WEEKDAY_MODIFIERS})
     {SEPARATOR}
     (?P<weekday>{WEEKDAYS})(?!\w)
     {END}
@@ -173,7 +180,7 @@ RELATIVE_COUNT_AGO = rf"""
 """
 RELATIVE_COUNT_IN = rf"""
     {START}
-    (?<!\w)(?:in)
+    (?<!\w)(?:{RELATIVE_IN})
     {SEPARATOR}
     (?P<rel_count>\d+)
     {SEPARATOR}
@@ -189,6 +196,27 @@ RELATIVE_COUNT_FROM_NOW = rf"""
     (?:from{SEPARATOR}now)(?!\w)
     {END}
 """
+# Zero-width lookahead matching wherever a date can begin. Scanning for these tokens is far cheaper
+# than attempting the full alternation at every position.
+ANCHORS = rf"(?={'|'.join(LEADING_TOKENS)})"
+
+# UNICODE (not ASCII) so the `\w` word guards treat accented letters as part of a word
+FLAGS = re.IGNORECASE | re.VERBOSE | re.MULTILINE | re.UNICODE | re.DOTALL
+
+
+@cache
+def _compile(pattern: str) -> re.Pattern:
+    """Compile a pattern with the shared flags, once per process.
+
+    Caching here means every PatternFactory sharing a first_number setting reuses the same compiled master pattern, and the anchor pattern is compiled only on first use.
+
+    Args:
+        pattern (str): The regex pattern source to compile
+
+    Returns:
+        re.Pattern: The compiled regex pattern
+    """
+    return re.compile(pattern, FLAGS)
 
 
 class PatternFactory:
@@ -225,7 +253,7 @@ class PatternFactory:
     def make_regex(self) -> re.Pattern:
         """Create a compiled regular expression pattern for matching dates in text.
 
-        Generate a regex pattern that matches various date formats including natural language dates (today, tomorrow, etc) and numeric dates. The order of numeric components is determined by the first_number setting specified during initialization.
+        Generate a regex pattern that matches various date formats including natural language dates (today, tomorrow, etc) and numeric dates. The order of numeric components is determined by the first_number setting specified during initialization. The compiled pattern is cached so the large alternation is only compiled once per first_number setting.
 
         Returns:
             re.Pattern: A compiled regex pattern with flags for case-insensitive and verbose matching
@@ -250,7 +278,17 @@ class PatternFactory:
             case _:  # pragma: no cover
                 assert_never(self.first_number)
 
-        return re.compile(
-            f"""{DD_MONTH_YYYY}|{MONTH_DD_YYYY}|{YYYY_MONTH_DD}|{MONTH_DD}|{YYYY_MONTH}|{MONTH_YYYY}|{NATURAL_DATE}|{RELATIVE_COUNT_AGO}|{RELATIVE_COUNT_IN}|{RELATIVE_COUNT_FROM_NOW}|{QUARTER_YYYY}|{YYYY_QUARTER}|{RELATIVE_WEEKDAY}|{yyyy_xx_xx}|{xx_xx_xx}|{YYYY_MM}|{MM_YYYY}|{yyyy_xxf_xxf}|{xxf_xxf_xxf}|{BARE_WEEKDAY}""",
-            re.IGNORECASE | re.VERBOSE | re.MULTILINE | re.UNICODE | re.DOTALL,
+        return _compile(
+            f"""{DD_MONTH_YYYY}|{MONTH_DD_YYYY}|{YYYY_MONTH_DD}|{MONTH_DD}|{YYYY_MONTH}|{MONTH_YYYY}|{NATURAL_DATE}|{RELATIVE_COUNT_AGO}|{RELATIVE_COUNT_IN}|{RELATIVE_COUNT_FROM_NOW}|{QUARTER_YYYY}|{YYYY_QUARTER}|{RELATIVE_WEEKDAY}|{yyyy_xx_xx}|{xx_xx_xx}|{YYYY_MM}|{MM_YYYY}|{yyyy_xxf_xxf}|{xxf_xxf_xxf}|{BARE_WEEKDAY}"""
         )
+
+    @staticmethod
+    def make_anchor_regex() -> re.Pattern:
+        """Create a compiled pattern that locates positions where a date match can begin.
+
+        The pattern is a zero-width lookahead over the leading tokens of every alternative in the master pattern, built from the same constants. It is compiled with the same flags so case folding agrees between the two, and cached so it is only compiled once.
+
+        Returns:
+            re.Pattern: A compiled zero-width regex pattern matching candidate start positions
+        """
+        return _compile(ANCHORS)
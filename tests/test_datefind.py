@@ -8,6 +8,8 @@ import pytest
 from freezegun import freeze_time
 
 from datefind import find_dates
+from datefind.constants import FirstNumber
+from datefind.datefind import DateFind
 
 fixture_file = Path(__file__).parent / "fixture.txt"
 
@@ -334,3 +336,106 @@ def test_find_dates_partial_match_in_word_context(debug):
     assert dates[0].datetime.strftime("%Y-%m-%d") == "2024-03-07"
     assert dates[0].match == "thursday"
     assert dates[0].span == (0, 8)
+
+
+def test_compiled_regex_is_shared_across_instances():
+    """Verify DateFind instances with the same first_number reuse one compiled pattern."""
+    # Given: two DateFind instances with the same first_number and one with a different one
+    first = DateFind(text="", tz=ZoneInfo("UTC"), first_number=FirstNumber.MONTH)
+    second = DateFind(text="", tz=ZoneInfo("UTC"), first_number=FirstNumber.MONTH)
+    other = DateFind(text="", tz=ZoneInfo("UTC"), first_number=FirstNumber.DAY)
+
+    # When/Then: the same compiled pattern object is shared only between matching settings
+    assert first._regex is second._regex
+    assert first._regex is not other._regex
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "23 march 2020",  # DD_MONTH_YYYY
+        "twentyfifth of march 2025",  # DD_MONTH_YYYY, spelled-out day
+        "march 23 2025",  # MONTH_DD_YYYY
+        "2024 march 5",  # YYYY_MONTH_DD
+        "sept the 5th",  # MONTH_DD
+        "2024 dec",  # YYYY_MONTH
+        "january of 1998",  # MONTH_YYYY
+        "today",  # NATURAL_DATE
+        "yesterday",
+        "tomorrow",
+        "last week",
+        "next month",
+        "this year",
+        "3 days ago",  # RELATIVE_COUNT_AGO
+        "in 2 weeks",  # RELATIVE_COUNT_IN
+        "1 year from now",  # RELATIVE_COUNT_FROM_NOW
+        "Q1 2024",  # QUARTER_YYYY
+        "2024-Q4",  # YYYY_QUARTER
+        "next Monday",  # RELATIVE_WEEKDAY
+        "last fri",
+        "this tues",
+        "2024-01-12",  # numeric patterns
+        "01122024",
+        "2022-12",
+        "12 2022",
+        "Sunday",  # BARE_WEEKDAY
+    ],
+)
+def test_anchors_cover_every_leading_token(text: str, debug):
+    """Verify the anchor pre-scan admits the leading token of every master-pattern alternative."""
+    # Given: a sample for each alternative, preceded by unrelated text
+    padded = f"xx {text}"
+    datefind = DateFind(text=padded, tz=ZoneInfo("UTC"), first_number=FirstNumber.MONTH)
+
+    # When: scanning with anchors and with a plain finditer
+    anchored = [match.span() for match in datefind._scan(0, len(padded))]
+    plain = [match.span() for match in datefind._regex.finditer(padded)]
+
+    # Then: the sample is matched in full and both scans agree
+    assert plain == [(3, len(padded))]
+    assert anchored == plain
+
+
+@pytest.mark.parametrize("first_number", list(FirstNumber))
+def test_anchored_scan_matches_finditer(first_number: FirstNumber, debug):
+    """Verify the anchor pre-scan finds exactly the matches a plain finditer would."""
+    # Given: the fixture text and a DateFind for each first_number setting
+    text = fixture_file.read_text()
+    datefind = DateFind(text=text, tz=ZoneInfo("UTC"), first_number=first_number)
+
+    # When: scanning with anchors and with a plain finditer
+    anchored = [match.span() for match in datefind._scan(0, len(text))]
+    plain = [match.span() for match in datefind._regex.finditer(text)]
+
+    # Then: both produce the same spans
+    assert anchored == plain
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["Saté", "Monção", "satén blanco", "Sunée", "éthursday", "13 days agoß"],
+)
+@freeze_time("2024-03-01")
+def test_no_match_inside_accented_words(text: str, debug):
+    """Verify weekday and relative-count guards treat accented letters as word characters."""
+    # Given: text where a date token is joined to non-ASCII letters
+    # When: finding dates
+    dates = list(find_dates(text, first="month", tz="UTC"))
+
+    # Then: no date is found inside the word
+    assert dates == []
+
+
+@freeze_time("2024-03-01")
+def test_unicode_case_folding_in_month_names(debug):
+    """Verify month names are matched and parsed under Unicode case folding."""
+    # Given: a month abbreviation starting with LATIN SMALL LETTER LONG S, which folds to "s"
+    text = "\u017fep 5 2024"
+
+    # When: finding dates
+    dates = list(find_dates(text, first="month", tz="UTC"))
+
+    # Then: the whole phrase is matched and parsed as September
+    assert len(dates) == 1
+    assert dates[0].match == text
+    assert dates[0].datetime == datetime(2024, 9, 5, tzinfo=ZoneInfo("UTC"))